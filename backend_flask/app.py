@@ -19,14 +19,12 @@ Responsibilities:
 4. Enable JWT authentication
 5. Connect MongoDB
 6. Register route blueprints
-7. Handle preflight OPTIONS requests
+7. Cache CORS preflight responses
 """
 
 # Import Flask core utilities
 # Flask → main application object
-# jsonify → send JSON responses
-# request → read incoming HTTP requests
-from flask import Flask, jsonify, request
+from flask import Flask
 
 # Enable Cross-Origin Resource Sharing (CORS)
 # Required to allow frontend (Vite/React) to call backend
@@ -38,15 +36,30 @@ from flask_jwt_extended import JWTManager
 # Import application configuration (secret keys, DB URL, etc.)
 from config import Config
 
-# Import database initialization function
-from models import init_db
+# Import database initialization & index creation functions
+from models import init_db, create_indexes
+
+# orjson-based JSON encoder for jsonify()
+from utils.json_provider import OrjsonProvider
+
+# Cached JWT verification (sets g.user_id)
+from utils.jwt_cache import init_jwt_cache
 
 # Import authentication and employee route blueprints
 from routes.auth import auth_bp
 from routes.employee import emp_bp
 
+import logging
 import os
 
+
+# -------------------------------------------------
+# Logging
+# -------------------------------------------------
+# Debug logs are skipped unless LOG_LEVEL=DEBUG
+# (default WARNING keeps request logs off stdout in production)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+
 # Create Flask application instance
 app = Flask(__name__)
 
@@ -66,6 +79,13 @@ app.url_map.strict_slashes = False
 app.config.from_object(Config)
 
 
+# -------------------------------------------------
+# Use orjson for JSON Responses
+# -------------------------------------------------
+# Faster encoding for jsonify() (e.g. employee lists)
+app.json = OrjsonProvider(app)
+
+
 # -------------------------------------------------
 # Enable CORS
 # -------------------------------------------------
@@ -86,9 +106,15 @@ app.config.from_object(Config)
 #     allow_headers=["Content-Type", "Authorization"]
 # )
 
+# Preflight (OPTIONS) requests are answered by Flask-CORS
+# max_age lets browsers cache the preflight for 24 hours,
+# so writes don't pay an extra OPTIONS round-trip each time
 CORS(
     app,
     resources={r"/api/*": {"origins": "*"}},
+    max_age=86400,
+    allow_headers=["Content-Type", "Authorization"],
+    methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
 )
 
 
@@ -102,22 +128,20 @@ jwt = JWTManager(app)
 
 
 # -------------------------------------------------
-# Initialize MongoDB Connection
+# Resolve JWT Identity (Cached)
 # -------------------------------------------------
-# Connects Flask app to MongoDB using configuration
-init_db(app)
+# Reads Bearer token once per request → g.user_id
+# Verified tokens are cached for a few seconds,
+# so repeated requests skip signature verification
+# Fails at startup if JWT_SECRET is not set
+init_jwt_cache(app)
 
 
 # -------------------------------------------------
-# Handle Preflight (OPTIONS) Requests
+# Initialize MongoDB Connection
 # -------------------------------------------------
-# Browsers send OPTIONS request before actual API call
-# This function prevents CORS-related blocking
-@app.before_request
-def handle_options():
-    # If request is preflight OPTIONS
-    if request.method == "OPTIONS":
-        return jsonify({}), 200
+# Connects Flask app to MongoDB using configuration
+init_db(app)
 
 
 # -------------------------------------------------
@@ -130,6 +154,17 @@ app.register_blueprint(auth_bp, url_prefix="/api/auth")
 app.register_blueprint(emp_bp, url_prefix="/api/employees")
 
 
+# -------------------------------------------------
+# CLI: Create Database Indexes
+# -------------------------------------------------
+# One-off command, run after deploy or after cleaning duplicates:
+#   flask --app app create-indexes
+@app.cli.command("create-indexes")
+def create_indexes_command():
+    create_indexes()
+    print("MongoDB indexes created ✅")
+
+
 # -------------------------------------------------
 # Root Test Route
 # -------------------------------------------------
@@ -148,7 +183,7 @@ if __name__ == "__main__":
     # Print startup message
     print("Starting Flask Server...")
 
-    # Start Flask development server
-    # debug=True enables auto reload & error debugger
+    # Start Flask development server (local use only)
+    # Production runs through gunicorn (see gunicorn.conf.py)
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port, debug=False)
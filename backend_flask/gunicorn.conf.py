@@ -0,0 +1,54 @@
+"""
+File: gunicorn.conf.py
+
+Purpose:
+- Production server settings for the Flask backend
+- Loaded automatically when running: gunicorn app:app
+
+Why This File Exists:
+- Flask's built-in server is meant for development only
+- Gunicorn runs several worker processes so slow requests
+  (bcrypt login, MongoDB calls) don't block each other
+"""
+
+import os
+
+
+# -------------------------------------------------
+# Bind Address
+# -------------------------------------------------
+# Uses PORT from environment (Render / Docker), default 5000
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+
+# -------------------------------------------------
+# Worker Processes
+# -------------------------------------------------
+# Common rule of thumb: (2 x CPU cores) + 1
+# Counts CPUs this process may run on (not all host cores),
+# capped because each worker opens its own MongoDB pool
+# Can be overridden with WEB_CONCURRENCY
+MAX_WORKERS = 8
+
+try:
+    cpus = len(os.sched_getaffinity(0))
+except AttributeError:
+    # sched_getaffinity is Linux-only
+    cpus = os.cpu_count() or 1
+
+workers = int(
+    os.environ.get("WEB_CONCURRENCY", min(cpus * 2 + 1, MAX_WORKERS))
+)
+
+
+# -------------------------------------------------
+# Threads per Worker
+# -------------------------------------------------
+# bcrypt releases the GIL while hashing, so with threaded
+# workers one login no longer stalls other requests
+# handled by the same worker process
+# Threads share module-level state (e.g. the JWT cache in
+# utils/jwt_cache.py, guarded by a lock) — check any new
+# shared state for thread safety before raising this
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
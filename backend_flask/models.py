@@ -13,13 +13,22 @@ Why This File Exists:
 - Follows clean architecture principles
 
 Flow:
-Flask App → init_db(app) → mongo.init_app(app) → MongoDB Connected
+Flask App → init_db(app) → mongo.init_app(app) → Create Indexes (best effort) → MongoDB Connected
 """
 
 # Import Flask-PyMongo extension
 # PyMongo simplifies MongoDB integration in Flask
 from flask_pymongo import PyMongo
 
+# Base class of all pymongo errors (connection, duplicate key, ...)
+from pymongo.errors import PyMongoError
+
+import logging
+
+
+# Module logger (level set in app.py via LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
 
 # Create a global PyMongo instance
 # This object will be initialized later with the Flask app
@@ -46,7 +55,46 @@ def init_db(app):
 
     # Attach the Flask app to the PyMongo instance
     # This reads MONGO_URI from app configuration
-    mongo.init_app(app)
+    # Extra options are passed to pymongo's MongoClient
+    mongo.init_app(
+        app,
+        maxPoolSize=app.config["MONGO_MAX_POOL_SIZE"],
+        minPoolSize=app.config["MONGO_MIN_POOL_SIZE"],
+        compressors=app.config["MONGO_COMPRESSORS"],
+        waitQueueTimeoutMS=2000,        # Fail fast if pool exhausted
+        serverSelectionTimeoutMS=3000,  # Fail fast if DB unreachable
+    )
+
+    # -------------------------------------------------
+    # Create Indexes (best effort)
+    # -------------------------------------------------
+    # Must not stop the app from booting if MongoDB is briefly
+    # unreachable or existing data still has duplicate emails.
+    # Run "flask --app app create-indexes" to create them explicitly.
+    try:
+        create_indexes()
+    except PyMongoError as e:
+        logger.error("Could not create MongoDB indexes: %s", e)
 
     # Print confirmation message in console
     print("MongoDB Connected ✅")
+
+
+def create_indexes():
+    """
+    Creates the indexes the routes rely on (no-op if they already exist).
+
+    Indexes:
+    - users.email → unique, one account per email
+    - employees (createdBy, email) → unique, one email per user's
+      employee list; also serves "find all employees of this user"
+
+    Existing duplicate emails make this fail with DuplicateKeyError;
+    remove them first (see README → Database Indexes).
+    """
+
+    mongo.db.users.create_index("email", unique=True)
+
+    mongo.db.employees.create_index(
+        [("createdBy", 1), ("email", 1)], unique=True
+    )
@@ -21,7 +21,8 @@ Responsibilities:
 # Import Blueprint to organize routes
 # request → get incoming JSON data
 # jsonify → send JSON responses
-from flask import Blueprint, request, jsonify
+# current_app → read app configuration
+from flask import Blueprint, request, jsonify, current_app
 
 # Import MongoDB connection instance
 from models import mongo
@@ -36,9 +37,18 @@ from utils.validators import (
 # bcrypt is used for secure password hashing
 import bcrypt
 
+import logging
+
 # Used to generate JWT tokens after successful login
 from flask_jwt_extended import create_access_token
 
+# Raised by MongoDB when a unique index is violated
+from pymongo.errors import DuplicateKeyError
+
+
+# Module logger (level set in app.py via LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
 
 # Create Blueprint for authentication routes
 # All auth-related endpoints will be grouped here
@@ -79,8 +89,8 @@ def register():
     email = data.get("email")
     password = data.get("password")
 
-    # Debug log (helps during development)
-    print("Register:", email)
+    # Debug log (only shown when LOG_LEVEL=DEBUG)
+    logger.debug("Register: %s", email)
 
     # -------------------------------------------------
     # Basic Empty Field Validation
@@ -103,28 +113,29 @@ def register():
     if not validate_password(password):
         return jsonify({"error": "Password must be 6+ chars"}), 400
 
-    # -------------------------------------------------
-    # Duplicate Email Check
-    # -------------------------------------------------
-    # Prevent creating multiple accounts with same email
-    if mongo.db.users.find_one({"email": email}):
-        return jsonify({"error": "Email already exists"}), 400
-
     # -------------------------------------------------
     # Password Hashing
     # -------------------------------------------------
     # Convert password to bytes and hash using bcrypt
-    hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt())
+    # Cost factor comes from config (BCRYPT_ROUNDS)
+    hashed = bcrypt.hashpw(
+        password.encode(),
+        bcrypt.gensalt(rounds=current_app.config["BCRYPT_ROUNDS"])
+    )
 
     # -------------------------------------------------
     # Store User in Database
     # -------------------------------------------------
     # Insert new user document into MongoDB
-    mongo.db.users.insert_one({
-        "name": name,
-        "email": email,
-        "password": hashed  # Store hashed password only
-    })
+    # Unique index on email prevents duplicate accounts
+    try:
+        mongo.db.users.insert_one({
+            "name": name,
+            "email": email,
+            "password": hashed  # Store hashed password only
+        })
+    except DuplicateKeyError:
+        return jsonify({"error": "Email already exists"}), 400
 
     # Return success response
     return jsonify({"message": "Registered Successfully"}), 201
@@ -162,7 +173,7 @@ def login():
     password = data.get("password")
 
     # Debug log
-    print("Login:", email)
+    logger.debug("Login: %s", email)
 
     # -------------------------------------------------
     # Empty Field Validation
@@ -188,6 +199,23 @@ def login():
     if not bcrypt.checkpw(password.encode(), user["password"]):
         return jsonify({"error": "Invalid credentials"}), 400
 
+    # -------------------------------------------------
+    # Upgrade Old Password Hash
+    # -------------------------------------------------
+    # Hash format: $2b$<rounds>$...
+    # If stored cost differs from BCRYPT_ROUNDS, re-hash once
+    # so future logins use the configured cost
+    rounds = current_app.config["BCRYPT_ROUNDS"]
+    if int(user["password"][4:6]) != rounds:
+        mongo.db.users.update_one(
+            {"_id": user["_id"]},
+            {"$set": {
+                "password": bcrypt.hashpw(
+                    password.encode(), bcrypt.gensalt(rounds=rounds)
+                )
+            }}
+        )
+
     # -------------------------------------------------
     # Generate JWT Token
     # -------------------------------------------------
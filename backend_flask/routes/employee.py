@@ -24,26 +24,48 @@ Validation:
 # Blueprint → Organizes routes
 # request → Access incoming JSON
 # jsonify → Return JSON response
-from flask import Blueprint, request, jsonify
+# Response / stream_with_context → Stream large responses
+# g → Per-request storage (logged-in user ID)
+from flask import Blueprint, request, jsonify, Response, stream_with_context, g
 
 # MongoDB connection instance
 from models import mongo
 
-# JWT protection utilities
-# jwt_required → Protect route
-# get_jwt_identity → Get logged-in user ID
-from flask_jwt_extended import jwt_required, get_jwt_identity
+# JWT protection (cached verification)
+# cached_jwt_required → Protect route
+# g.user_id → Logged-in user ID (set before each request in app.py)
+from utils.jwt_cache import cached_jwt_required
 
 # Import validation helper functions
-from utils.validators import (
-    validate_salary,
-    validate_email_format,
-    validate_name,
-    validate_text_field,
-)
+from utils.validators import validate_employee
 
 # Required to convert string ID into MongoDB ObjectId
+# InvalidId → raised for malformed ID strings
 from bson import ObjectId
+from bson.errors import InvalidId
+
+# ReturnDocument → get updated document back from find_one_and_update
+from pymongo import ReturnDocument
+
+# Raised by MongoDB when a unique index is violated
+# BulkWriteError → raised by insert_many (holds per-row errors)
+from pymongo.errors import DuplicateKeyError, BulkWriteError
+
+import logging
+
+# Fast JSON encoding for streamed responses
+import orjson
+
+
+# Module logger (level set in app.py via LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+
+# Max employees accepted in one bulk request
+MAX_BULK_SIZE = 1000
+
+# MongoDB error code for unique index violation
+DUPLICATE_KEY_CODE = 11000
 
 
 # Create Blueprint for employee routes
@@ -54,7 +76,7 @@ emp_bp = Blueprint("employee", __name__)
 #                    CREATE EMPLOYEE
 # =====================================================
 @emp_bp.route("", methods=["POST"])
-@jwt_required()  # 🔐 Route protected with JWT
+@cached_jwt_required()  # 🔐 Route protected with JWT
 def create_employee():
     """
     Route: POST /employees
@@ -70,7 +92,7 @@ def create_employee():
     data = request.get_json()
 
     # Get logged-in user ID from JWT
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
     # Extract fields safely with default empty string
     name = data.get("name", "").strip()
@@ -80,85 +102,190 @@ def create_employee():
     salary = data.get("salary")
 
     # Debug log
-    print("Add Employee:", data)
+    logger.debug("Add Employee: %s", data)
 
     # ---------------- VALIDATION ----------------
+    # Name, email, department, role & salary checked in one call
+    error = validate_employee(name, email, department, designation, salary)
+    if error:
+        return jsonify({"error": error}), 400
 
-    # Validate name
-    if not validate_name(name):
-        return jsonify({"error": "Invalid Name"}), 400
+    # ---------------- INSERT INTO DATABASE ----------------
+    # Unique (createdBy, email) index prevents duplicate
+    # employee email for same user
+    try:
+        mongo.db.employees.insert_one({
+            "name": name,
+            "email": email,
+            "department": department,
+            "designation": designation,
+            "salary": int(salary),
+            "createdBy": user_id  # Link employee to user
+        })
+    except DuplicateKeyError:
+        return jsonify({"error": "Email already exists"}), 400
 
-    # Validate email format
-    if not validate_email_format(email):
-        return jsonify({"error": "Invalid Email"}), 400
+    return jsonify({"message": "Employee Added"}), 201
 
-    # Validate department text
-    if not validate_text_field(department):
-        return jsonify({"error": "Invalid Department"}), 400
 
-    # Validate designation text
-    if not validate_text_field(designation):
-        return jsonify({"error": "Invalid Role"}), 400
+# =====================================================
+#                 BULK CREATE EMPLOYEES
+# =====================================================
+@emp_bp.route("/bulk", methods=["POST"])
+@cached_jwt_required()
+def bulk_create_employees():
+    """
+    Route: POST /employees/bulk
 
-    # Validate salary numeric & > 0
-    if not validate_salary(salary):
-        return jsonify({"error": "Invalid Salary"}), 400
+    Purpose:
+    - Create many employee records in one request
+    - Validate every row before inserting anything
+    - Insert all rows with a single database call
+    - Report emails skipped as duplicates
+      (400 if every row was a duplicate, like other duplicate errors)
+
+    Expected JSON Input:
+    [
+        {"name": "...", "email": "...", "department": "...",
+         "designation": "...", "salary": 50000},
+        ...
+    ]
+    """
 
-    # ---------------- DUPLICATE CHECK ----------------
-    # Prevent duplicate employee email for same user
-    if mongo.db.employees.find_one({
-        "email": email,
-        "createdBy": user_id
-    }):
-        return jsonify({"error": "Email already exists"}), 400
+    data = request.get_json()
+    user_id = g.user_id
 
-    # ---------------- INSERT INTO DATABASE ----------------
-    mongo.db.employees.insert_one({
-        "name": name,
-        "email": email,
-        "department": department,
-        "designation": designation,
-        "salary": int(salary),
-        "createdBy": user_id  # Link employee to user
-    })
+    if not isinstance(data, list) or not data:
+        return jsonify({"error": "Expected a list of employees"}), 400
 
-    return jsonify({"message": "Employee Added"}), 201
+    if len(data) > MAX_BULK_SIZE:
+        return jsonify({
+            "error": f"Max {MAX_BULK_SIZE} employees per request"
+        }), 400
+
+    logger.debug("Bulk Add Employees: %d rows", len(data))
+
+    # ---------------- VALIDATION ----------------
+    # Reject the whole batch if any row is invalid
+    docs = []
+    for row, item in enumerate(data):
+        if not isinstance(item, dict):
+            return jsonify({"error": "Invalid Employee", "row": row}), 400
+
+        # Text fields must be strings (null / numbers are rejected,
+        # not converted — str(None) would pass as "None")
+        fields = [
+            item.get(key, "")
+            for key in ("name", "email", "department", "designation")
+        ]
+        if not all(isinstance(value, str) for value in fields):
+            return jsonify({"error": "Invalid Employee", "row": row}), 400
+
+        name, email, department, designation = (
+            value.strip() for value in fields
+        )
+        salary = item.get("salary")
+
+        error = validate_employee(name, email, department, designation, salary)
+        if error:
+            return jsonify({"error": error, "row": row}), 400
+
+        docs.append({
+            "name": name,
+            "email": email,
+            "department": department,
+            "designation": designation,
+            "salary": int(salary),
+            "createdBy": user_id  # Link employee to user
+        })
+
+    # ---------------- INSERT INTO DATABASE ----------------
+    # ordered=False → keep inserting after a duplicate row
+    duplicates = []
+    try:
+        inserted = len(
+            mongo.db.employees.insert_many(docs, ordered=False).inserted_ids
+        )
+    except BulkWriteError as e:
+        # Any error other than a duplicate email is unexpected
+        errors = e.details["writeErrors"]
+        if any(err["code"] != DUPLICATE_KEY_CODE for err in errors):
+            raise
+
+        inserted = e.details["nInserted"]
+        duplicates = [docs[err["index"]]["email"] for err in errors]
+
+    # Every row was a duplicate → nothing created
+    if inserted == 0:
+        return jsonify({
+            "error": "Email already exists",
+            "inserted": 0,
+            "duplicates": duplicates
+        }), 400
+
+    return jsonify({
+        "message": "Employees Added",
+        "inserted": inserted,
+        "duplicates": duplicates
+    }), 201
 
 
 # =====================================================
 #                    READ EMPLOYEES
 # =====================================================
 @emp_bp.route("", methods=["GET"])
-@jwt_required()
+@cached_jwt_required()
 def get_employees():
     """
     Route: GET /employees
 
     Purpose:
     - Fetch all employees created by logged-in user
+    - Return only fields needed by frontend
     - Convert MongoDB ObjectId to string
+    - Stream response instead of building it in memory
     """
 
     # Get logged-in user ID
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
     # Fetch employees belonging to this user only
-    employees = list(
-        mongo.db.employees.find({"createdBy": user_id})
-    )
-
-    # Convert ObjectId to string for JSON response
-    for emp in employees:
+    # Projection skips fields the frontend never uses (createdBy)
+    cursor = mongo.db.employees.find(
+        {"createdBy": user_id},
+        {"createdBy": 0}
+    ).batch_size(100)
+
+    # Run the query before any bytes are sent, so a database
+    # error still becomes a normal error response (not a cut-off "[")
+    first = next(cursor, None)
+
+    def encode(emp):
+        # Convert ObjectId to string for JSON response
         emp["_id"] = str(emp["_id"])
-
-    return jsonify(employees)
+        return orjson.dumps(emp, default=str)
+
+    # Stream JSON array one employee at a time
+    # Only one MongoDB batch is held in memory
+    def generate():
+        yield b"["
+        if first is not None:
+            yield encode(first)
+            for emp in cursor:
+                yield b"," + encode(emp)
+        yield b"]"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="application/json"
+    )
 
 
 # =====================================================
 #                    UPDATE EMPLOYEE
 # =====================================================
 @emp_bp.route("/<id>", methods=["PUT"])
-@jwt_required()
+@cached_jwt_required()
 def update_employee(id):
     """
     Route: PUT /employees/<id>
@@ -168,10 +295,17 @@ def update_employee(id):
     - Validate all fields
     - Prevent duplicate email
     - Ensure user owns the employee
+    - Return the updated employee
     """
 
+    # Reject malformed ID before touching the database
+    try:
+        oid = ObjectId(id)
+    except InvalidId:
+        return jsonify({"error": "Invalid ID"}), 400
+
     data = request.get_json()
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
     # Extract and clean fields
     name = data.get("name", "").strip()
@@ -180,60 +314,49 @@ def update_employee(id):
     designation = data.get("designation", "").strip()
     salary = data.get("salary")
 
-    print("Update:", data)
+    logger.debug("Update: %s", data)
 
     # ---------------- VALIDATION ----------------
-
-    if not validate_name(name):
-        return jsonify({"error": "Invalid Name"}), 400
-
-    if not validate_email_format(email):
-        return jsonify({"error": "Invalid Email"}), 400
-
-    if not validate_text_field(department):
-        return jsonify({"error": "Invalid Department"}), 400
-
-    if not validate_text_field(designation):
-        return jsonify({"error": "Invalid Role"}), 400
-
-    if not validate_salary(salary):
-        return jsonify({"error": "Invalid Salary"}), 400
-
-    # ---------------- DUPLICATE CHECK ----------------
-    # Exclude current employee ID from duplicate check
-    if mongo.db.employees.find_one({
-        "email": email,
-        "createdBy": user_id,
-        "_id": {"$ne": ObjectId(id)}
-    }):
-        return jsonify({"error": "Email already exists"}), 400
+    error = validate_employee(name, email, department, designation, salary)
+    if error:
+        return jsonify({"error": error}), 400
 
     # ---------------- UPDATE DATABASE ----------------
-    result = mongo.db.employees.update_one(
-        {"_id": ObjectId(id), "createdBy": user_id},
-        {
-            "$set": {
-                "name": name,
-                "email": email,
-                "department": department,
-                "designation": designation,
-                "salary": int(salary),
-            }
-        }
-    )
+    # Single round-trip: match, update and return new document
+    # Unique (createdBy, email) index rejects an email
+    # already used by another employee of this user
+    try:
+        employee = mongo.db.employees.find_one_and_update(
+            {"_id": oid, "createdBy": user_id},
+            {
+                "$set": {
+                    "name": name,
+                    "email": email,
+                    "department": department,
+                    "designation": designation,
+                    "salary": int(salary),
+                }
+            },
+            projection={"createdBy": 0},
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        return jsonify({"error": "Email already exists"}), 400
 
     # If no document matched → user not authorized
-    if result.matched_count == 0:
+    if employee is None:
         return jsonify({"error": "Not authorized"}), 403
 
-    return jsonify({"message": "Updated"})
+    employee["_id"] = str(employee["_id"])
+
+    return jsonify({"message": "Updated", "employee": employee})
 
 
 # =====================================================
 #                    DELETE EMPLOYEE
 # =====================================================
 @emp_bp.route("/<id>", methods=["DELETE"])
-@jwt_required()
+@cached_jwt_required()
 def delete_employee(id):
     """
     Route: DELETE /employees/<id>
@@ -243,11 +366,17 @@ def delete_employee(id):
     - Ensure user owns the employee
     """
 
-    user_id = get_jwt_identity()
+    # Reject malformed ID before touching the database
+    try:
+        oid = ObjectId(id)
+    except InvalidId:
+        return jsonify({"error": "Invalid ID"}), 400
+
+    user_id = g.user_id
 
     # Delete only if employee belongs to logged-in user
     result = mongo.db.employees.delete_one({
-        "_id": ObjectId(id),
+        "_id": oid,
         "createdBy": user_id
     })
 
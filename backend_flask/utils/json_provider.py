@@ -0,0 +1,38 @@
+# utils/json_provider.py
+# Fast JSON encoding for all jsonify() responses
+#
+# orjson (Rust) is several times faster than the standard json module.
+# Used in app.py via: app.json = OrjsonProvider(app)
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class OrjsonProvider(JSONProvider):
+
+    # ================= ENCODE =================
+    def _dumps_bytes(self, obj):
+        # default=str → handles ObjectId and other unknown types
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+    def dumps(self, obj, **kwargs):
+        # Text output, for callers that need a str
+        return self._dumps_bytes(obj).decode()
+
+    # ================= RESPONSE =================
+    def response(self, *args, **kwargs):
+        # Used by jsonify(): pass orjson's bytes straight through,
+        # skipping the bytes → str → bytes round-trip of the base class
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self._dumps_bytes(obj),
+            mimetype="application/json"
+        )
+
+    # ================= DECODE =================
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
@@ -0,0 +1,125 @@
+# utils/jwt_cache.py
+# Short-lived cache of verified JWT tokens
+#
+# The same bearer token is sent with every request for its whole lifetime,
+# so re-checking its signature each time is wasted work.
+# Verified tokens are remembered for a few seconds (never past their expiry).
+
+import hashlib
+import threading
+import time
+from functools import wraps
+
+import jwt
+from cachetools import TTLCache
+from flask import g, jsonify, request
+from jwt.exceptions import PyJWTError
+
+
+# Max seconds a verified token is trusted without re-checking
+CACHE_TTL = 30
+
+# sha256(token) → (identity, exp)
+# Only the hash is stored, never the raw token
+_cache = TTLCache(maxsize=10000, ttl=CACHE_TTL)
+
+# cachetools caches are not thread-safe and gunicorn runs
+# several request threads per worker, so every access is locked
+_cache_lock = threading.Lock()
+
+# Tokens are issued by flask_jwt_extended (HS256)
+# Verified directly with PyJWT; secret bytes & algorithm list
+# are built once (see init_jwt_cache) instead of on every decode
+_jwt = jwt.PyJWT()
+_SECRET = None
+_ALGORITHMS = ["HS256"]
+_OPTIONS = {"require": ["exp", "sub"]}
+
+
+# ================= SETUP =================
+def init_jwt_cache(app):
+    # Called once from app.py after config is loaded
+    # Reads the secret from app.config (so app-level overrides apply)
+    # and refuses to start without one
+    global _SECRET
+
+    secret = app.config.get("JWT_SECRET_KEY")
+    if not secret:
+        raise RuntimeError("JWT_SECRET is not set")
+
+    _SECRET = secret.encode() if isinstance(secret, str) else secret
+
+    app.before_request(load_identity)
+
+
+# ================= TOKEN LOOKUP =================
+def _bearer_token():
+    # Read "Authorization: Bearer <token>" header
+    header = request.headers.get("Authorization", "")
+
+    if not header.startswith("Bearer "):
+        return None
+
+    return header[7:].strip() or None
+
+
+def resolve_identity(token):
+    # Returns user ID for a valid token, None otherwise
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+
+    # Cache hit → skip signature verification
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached and cached[1] > now:
+        return cached[0]
+
+    # Cache miss → full verification
+    try:
+        decoded = _jwt.decode(
+            token,
+            _SECRET,
+            algorithms=_ALGORITHMS,
+            options=_OPTIONS
+        )
+    except PyJWTError:
+        return None
+
+    # Only access tokens may call the API
+    if decoded.get("type") != "access":
+        return None
+
+    identity = decoded["sub"]
+
+    # Never cache past the token's own expiry
+    if decoded["exp"] > now:
+        with _cache_lock:
+            _cache[key] = (identity, min(decoded["exp"], now + CACHE_TTL))
+
+    return identity
+
+
+# ================= REQUEST HOOK =================
+def load_identity():
+    # Registered as before_request by init_jwt_cache
+    # Token is decoded once per request; routes read g.user_id
+
+    # CORS preflight never carries a token, skip straight to Flask-CORS
+    if request.method == "OPTIONS":
+        return
+
+    token = _bearer_token()
+    g.user_id = resolve_identity(token) if token else None
+
+
+# ================= ROUTE DECORATOR =================
+def cached_jwt_required():
+    # Replacement for @jwt_required() backed by the cache above
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            if g.get("user_id") is None:
+                return jsonify({"error": "Invalid or missing token"}), 401
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
@@ -5,16 +5,20 @@ import re
 from email_validator import validate_email, EmailNotValidError
 
 
-# ================= EMAIL =================
-# ================= EMAIL =================
-def validate_email_format(email):
-
-    import re
+# ================= PATTERNS =================
+# Compiled once at import instead of on every call
+# Name, department & role share one rule: letters + spaces (2–50 chars)
+_TEXT_RE = re.compile(r"[A-Za-z ]{2,50}")
 
-    pattern = r"^(?!.*\.\.)[a-zA-Z0-9](?:[a-zA-Z0-9._%+-]{4,28})[a-zA-Z0-9]@gmail\.com$"
-
-    return bool(re.fullmatch(pattern, email))
 
+# ================= EMAIL =================
+def validate_email_format(email):
+    # Any valid address (syntax only, no DNS lookup)
+    try:
+        validate_email(email, check_deliverability=False)
+        return True
+    except EmailNotValidError:
+        return False
 
 
 # ================= PASSWORD =================
@@ -26,13 +30,13 @@ def validate_password(password):
 # ================= NAME =================
 def validate_name(name):
     # Only letters + spaces (2–50 chars)
-    return bool(re.fullmatch(r"[A-Za-z ]{2,50}", name))
+    return _TEXT_RE.fullmatch(name) is not None
 
 
 # ================= TEXT FIELD =================
 def validate_text_field(value):
     # For department / role (letters only)
-    return bool(re.fullmatch(r"[A-Za-z ]{2,50}", value))
+    return _TEXT_RE.fullmatch(value) is not None
 
 
 # ================= SALARY =================
@@ -42,3 +46,26 @@ def validate_salary(salary):
         return salary > 0
     except:
         return False
+
+
+# ================= EMPLOYEE =================
+def validate_employee(name, email, department, designation, salary):
+    # All employee field checks in one call
+    # Returns error message, or None if valid
+
+    # Name, department & role checked in one pass (same pattern)
+    # Only on failure do we look up which field was wrong
+    if not all(_TEXT_RE.fullmatch(x) for x in (name, department, designation)):
+        if not validate_name(name):
+            return "Invalid Name"
+        if not validate_text_field(department):
+            return "Invalid Department"
+        return "Invalid Role"
+
+    if not validate_email_format(email):
+        return "Invalid Email"
+
+    if not validate_salary(salary):
+        return "Invalid Salary"
+
+    return None